@@ -1,9 +1,19 @@
+# Patch the standard library for cooperative green threads before anything
+# else imports it, so blocking LLM calls yield instead of holding OS threads
+import eventlet
+eventlet.monkey_patch()
+
 from flask import Flask, request, jsonify
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import json
+import hashlib
 import os
-from threading import Thread
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+import msgspec
+import orjson
+from threading import Lock, Event
 from crewai import Agent, Task, Crew, Process
 from crewai import LLM
 import logging
@@ -12,9 +22,203 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonModule:
+    """Drop-in for the json module used by python-socketio, backed by orjson."""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson always produces compact output, so separators etc. are ignored
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}}) 
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', path='/api/ws')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet', path='/api/ws', json=OrjsonModule)
+
+# CrewAI step logging is costly on the streaming path, so it is opt-in
+CREW_VERBOSE = os.getenv('CREW_VERBOSE') == '1'
+
+# Minimum number of recent messages included in the prompt. The window only
+# grows (keeping the prompt prefix stable for provider-side prompt caching)
+# until it reaches twice this size, then slides forward in one step.
+HISTORY_WINDOW = 6
+
+# Display labels for the common history roles
+_ROLE_MAP = {'user': 'User', 'assistant': 'Assistant', 'system': 'System', 'unknown': 'Unknown'}
+
+def _role_label(role):
+    """Return the display label for a history message role."""
+    return _ROLE_MAP.get(role) or role.capitalize()
+
+def _format_history_line(msg):
+    """Format a single history message for the prompt."""
+    return f"{_role_label(msg.role)}: {msg.content}"
+
+# Streamed tokens are batched into a single emit once this many are buffered
+# or the oldest buffered token has waited this many seconds
+TOKEN_BATCH_SIZE = 8
+TOKEN_FLUSH_INTERVAL = 0.05
+
+# Streaming pauses once this many token emits are unacknowledged by the client,
+# resuming when half of them have been acknowledged or after the timeout
+ACK_HIGH_WATERMARK = 64
+ACK_TIMEOUT = 10
+
+# CrewAI runs go through a bounded worker pool; once this many are waiting
+# for a free worker, new messages are rejected straight away
+WORKER_POOL_SIZE = 32
+MAX_QUEUED_REQUESTS = 64
+
+# Longest user message accepted, in characters
+MAX_INPUT_LENGTH = 8192
+
+# Number of responses kept in the LRU response cache, and the number of
+# characters sent per emit when replaying a cached response
+RESPONSE_CACHE_SIZE = 1024
+CACHED_CHUNK_SIZE = 256
+
+# Task description template. The static instructions come first so the
+# prompt prefix stays identical across turns and can be cached; everything
+# that changes per request goes at the end.
+_TASK_TMPL = """
+                    Respond in a friendly, conversational manner that:
+                    1. Acknowledges their input naturally
+                    2. References the current title/topic if relevant
+                    3. Provides helpful insight or asks a follow-up question
+                    
+                    Your response should be conversational, warm, and avoid generic chatbot phrases like "How can I assist you".
+                    
+                    ---
+                    
+                    Title Context: {title}
+                    Abstract Context: {abstract}
+                    
+                    Previous conversation:
+                    {history}
+                    
+                    The user has sent: "{user_input}"
+                    """
+
+# Messages that slide out of the history window are condensed into a short
+# running summary that is sent ahead of the window
+SUMMARY_MAX_TOKENS = 200
+# Summaries run on their own small pool so they never take chat workers
+SUMMARY_POOL_SIZE = 4
+
+_SUMMARY_TMPL = """Update the summary of a conversation about business ideas with the new messages below.
+Keep it under 150 words and preserve names, decisions and open questions.
+
+Current summary:
+{summary}
+
+New messages:
+{messages}"""
+
+class RunCancelled(BaseException):
+    """Raised inside a CrewAI run that was superseded by a newer message.
+    
+    Derives from BaseException so CrewAI's ``except Exception`` retry loop in
+    Agent.execute_task lets it through instead of re-running the task.
+    """
+
+class StreamingObserver:
+    """Streams LLM tokens to a single client.
+    
+    Tokens are buffered and sent in batches to cut down on per-emit encoding
+    and socket writes.
+    """
+    
+    def __init__(self, sid):
+        self.sid = sid
+        self.buf = []
+        self.last_flush = time.monotonic()
+        self.lock = Lock()
+        self.timer_pending = False
+        # Backpressure state: emits are numbered so the client
+        # can detect gaps, and acknowledged by the client
+        self.emit_lock = Lock()
+        self.seq = 0
+        self.pending = 0
+        self.pending_lock = Lock()
+        self.drained = Event()
+        # Cancellation flag of the run currently streaming to this client
+        self.cancelled = None
+    
+    def on_new_token(self, token, **kwargs):
+        with self.lock:
+            if self.cancelled is not None and self.cancelled.is_set():
+                # Abort the superseded run and drop what it produced
+                self.buf = []
+                raise RunCancelled()
+            self.buf.append(token)
+            due = (len(self.buf) >= TOKEN_BATCH_SIZE
+                   or time.monotonic() - self.last_flush > TOKEN_FLUSH_INTERVAL)
+            start_timer = not due and not self.timer_pending
+            if start_timer:
+                self.timer_pending = True
+        if due:
+            self.flush()
+        elif start_timer:
+            # Make sure a trailing partial batch is not held back
+            socketio.start_background_task(self._flush_later)
+    
+    def _flush_later(self):
+        socketio.sleep(TOKEN_FLUSH_INTERVAL)
+        with self.lock:
+            self.timer_pending = False
+        self.flush()
+    
+    def flush(self):
+        with self.emit_lock:
+            # Tokens keep accumulating while we wait on a slow
+            # client and are then sent as one larger batch
+            self._wait_for_client()
+            with self.lock:
+                # A superseded run's leftovers must not reach the client
+                if self.cancelled is not None and self.cancelled.is_set():
+                    chunk = ''
+                else:
+                    chunk = ''.join(self.buf)
+                self.buf = []
+                self.last_flush = time.monotonic()
+            if chunk:
+                self._emit(chunk)
+    
+    def send(self, chunk):
+        """Send text straight to the client, bypassing the buffer."""
+        with self.emit_lock:
+            self._wait_for_client()
+            self._emit(chunk)
+    
+    def _emit(self, chunk):
+        # Tokens go out on their own event as a bare string plus
+        # sequence number, avoiding a wrapper dict per batch. Multiple
+        # arguments must be passed to emit as a tuple.
+        self.seq += 1
+        with self.pending_lock:
+            self.pending += 1
+        socketio.emit('tok', (chunk, self.seq), room=self.sid, namespace='/api/ws', callback=self._on_ack)
+    
+    def _wait_for_client(self):
+        with self.pending_lock:
+            if self.pending < ACK_HIGH_WATERMARK:
+                return
+            self.drained.clear()
+        if not self.drained.wait(ACK_TIMEOUT):
+            # Start counting afresh so a client that stopped acking is not
+            # stalled again on every following batch
+            logger.warning(f"Client {self.sid} is not acknowledging tokens, resuming anyway")
+            with self.pending_lock:
+                self.pending = 0
+    
+    def _on_ack(self, *args):
+        with self.pending_lock:
+            self.pending = max(self.pending - 1, 0)
+            if self.pending <= ACK_HIGH_WATERMARK // 2:
+                self.drained.set()
 
 class CrewAIHandler:
     def __init__(self):
@@ -22,89 +226,341 @@ class CrewAIHandler:
             model="azure/gpt-4o-mini",
             temperature=0.7
         )
+        # Short-output LLM used to summarize history outside the window
+        self.summary_llm = LLM(
+            model="azure/gpt-4o-mini",
+            temperature=0.3,
+            max_tokens=SUMMARY_MAX_TOKENS
+        )
+        # Summary of the history before the window for each client as
+        # (number of messages covered, first message, summary text)
+        self._summaries = {}
+        # Summary job in progress for each client, tagged with the
+        # (window start, first message) it was built from
+        self._summarizing = {}
+        self._summary_lock = Lock()
+        self._summary_pool = ThreadPoolExecutor(max_workers=SUMMARY_POOL_SIZE, thread_name_prefix='summary')
+        # Start index of the history window for each client
+        self._window_start = {}
+        # Last formatted history per client as
+        # (window start, length, last message, text)
+        self._fmt_cache = {}
+        # Agents and crews are expensive to build, so keep one per client
+        self._agents = {}
+        self._crews = {}
+        self._observers = {}
+        # Completed responses keyed by a hash of the request
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+        # Bounded pool for CrewAI runs and the number of runs waiting on it
+        self._pool = ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE, thread_name_prefix='crew')
+        self._queued = 0
+        self._queued_lock = Lock()
+        # Run in flight for each client as (future, cancellation flag)
+        self._inflight = {}
+        self._inflight_lock = Lock()
         
     def process_streaming(self, user_input, title_context="", abstract_context="", conversation_history=None, sid=None):
         """Process a user message using CrewAI"""
         
+        # Replay a cached response if this exact request was answered before
+        cache_key = self._cache_key(user_input, title_context, abstract_context, conversation_history)
+        cached = self._cache_get(cache_key)
+        
         # Format conversation history for better context
-        formatted_history = self._format_conversation_history(conversation_history)
+        if cached is None:
+            formatted_history = self._format_conversation_history(conversation_history, sid)
+        
+        # Fail fast rather than queueing indefinitely when the pool is saturated
+        with self._queued_lock:
+            if self._queued >= MAX_QUEUED_REQUESTS:
+                busy = True
+            else:
+                busy = False
+                self._queued += 1
+        if busy:
+            logger.warning("Worker pool saturated, rejecting message")
+            socketio.emit('message', {'error': 'Server busy, please try again shortly'}, room=sid, namespace='/api/ws')
+            socketio.emit('message', {'done': True}, room=sid, namespace='/api/ws')
+            return
+        
+        # Only one run per client: the accepted message supersedes the one
+        # in flight
+        prev = self._cancel_inflight(sid)
+        
+        # Run on the worker pool to not block the main thread
+        cancelled = Event()
         
-        # Run in a separate thread to not block the main thread
         def run_process():
+            with self._queued_lock:
+                self._queued -= 1
+            # The superseded run stops at its next token; wait for it so the
+            # two never share the client's observer and crew at once
+            if prev is not None:
+                wait([prev])
+            if cancelled.is_set():
+                return
             try:
-                # Set up observer for streaming
-                class StreamingObserver:
-                    def on_new_token(self, token, **kwargs):
-                        socketio.emit('message', {'token': token}, room=sid)
+                observer = self._get_observer(sid)
+                observer.cancelled = cancelled
                 
-                # Set up agent for conversation
-                agent = Agent(
-                    role="Conversation Guide",
-                    goal="Engage users in friendly conversation about business ideas",
-                    backstory="You help develop startup ideas with natural, concise responses.",
-                    verbose=True,
-                    llm=self.llm,
-                    output_observer=StreamingObserver()
-                )
+                if cached is not None:
+                    # Replay the cached response in chunks
+                    for i in range(0, len(cached), CACHED_CHUNK_SIZE):
+                        if cancelled.is_set():
+                            raise RunCancelled()
+                        observer.send(cached[i:i + CACHED_CHUNK_SIZE])
+                else:
+                    self._run_crew(sid, user_input, title_context, abstract_context, formatted_history, cache_key)
+                if cancelled.is_set():
+                    raise RunCancelled()
                 
-                # Create task
-                task = Task(
-                    description=f"""
-                    The user has sent: "{user_input}"
-                    
-                    Title Context: {title_context}
-                    Abstract Context: {abstract_context}
-                    
-                    Previous conversation:
-                    {formatted_history}
-                    
-                    Respond in a friendly, conversational manner that:
-                    1. Acknowledges their input naturally
-                    2. References the current title/topic if relevant
-                    3. Provides helpful insight or asks a follow-up question
-                    
-                    Your response should be conversational, warm, and avoid generic chatbot phrases like "How can I assist you".
-                    """,
-                    agent=agent,
-                    expected_output="A natural, conversational response"
-                )
-                
-                # Create and run crew
-                crew = Crew(
-                    agents=[agent],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=True
-                )
-                
-                # Run the crew
-                result = crew.kickoff()
-                
-                # Signal completion
-                socketio.emit('message', {'done': True}, room=sid)
+                # Send any buffered tokens, then signal completion
+                self._flush_tokens(sid)
+                socketio.emit('message', {'done': True}, room=sid, namespace='/api/ws')
                 
+            except RunCancelled:
+                logger.info(f"Run for client {sid} superseded by a newer message")
             except Exception as e:
                 logger.error(f"Error in CrewAI process: {str(e)}")
-                socketio.emit('message', {'error': str(e)}, room=sid)
-                socketio.emit('message', {'done': True}, room=sid)
+                self._flush_tokens(sid)
+                socketio.emit('message', {'error': str(e)}, room=sid, namespace='/api/ws')
+                socketio.emit('message', {'done': True}, room=sid, namespace='/api/ws')
+            finally:
+                with self._inflight_lock:
+                    if self._inflight.get(sid, (None, None))[1] is cancelled:
+                        del self._inflight[sid]
         
-        # Start process in background thread
-        thread = Thread(target=run_process)
-        thread.daemon = True
-        thread.start()
+        # Start process in background
+        with self._inflight_lock:
+            self._inflight[sid] = (self._pool.submit(run_process), cancelled)
         
-    def _format_conversation_history(self, conversation_history):
+    def _run_crew(self, sid, user_input, title_context, abstract_context, formatted_history, cache_key):
+        """Run the client's crew on a message, streaming tokens as they arrive."""
+        # Reuse the agent built for this client
+        agent = self._get_agent(sid)
+        
+        # Create task
+        task = Task(
+            description=_TASK_TMPL.format_map({
+                'user_input': user_input,
+                'title': title_context,
+                'abstract': abstract_context,
+                'history': formatted_history,
+            }),
+            agent=agent,
+            expected_output="A natural, conversational response"
+        )
+        
+        # Reuse the client's crew with the new task
+        crew = self._get_crew(sid, task)
+        
+        # The agent is reused, so give each run the full retry budget
+        agent._times_executed = 0
+        
+        # Run the crew
+        result = crew.kickoff()
+        
+        if result:
+            self._cache_put(cache_key, str(result))
+
+    def _cancel_inflight(self, sid):
+        """Cancel the run in flight for a client and return its future, if any."""
+        with self._inflight_lock:
+            entry = self._inflight.pop(sid, None)
+        if entry is None:
+            return None
+        future, cancelled = entry
+        cancelled.set()
+        # Drop tokens it has buffered but not yet sent
+        observer = self._observers.get(sid)
+        if observer is not None:
+            with observer.lock:
+                observer.buf = []
+        if future.cancel():
+            # It never started, so it will not decrement the queue itself
+            with self._queued_lock:
+                self._queued -= 1
+        return future
+
+    def _cache_key(self, user_input, title_context, abstract_context, conversation_history):
+        """Hash a request together with the tail of its conversation history."""
+        recent = orjson.dumps([(msg.role, msg.content) for msg in (conversation_history or [])[-3:]]).decode()
+        raw = f"{user_input}|{title_context}|{abstract_context}|{recent}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key):
+        """Return a cached response, marking it as recently used."""
+        with self._cache_lock:
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+            return response
+
+    def _cache_put(self, key, response):
+        """Store a response, evicting the least recently used one if full."""
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _get_agent(self, sid):
+        """Return the conversation agent for a client, creating it on first use."""
+        agent = self._agents.get(sid)
+        if agent is None:
+            # Set up agent for conversation
+            agent = Agent(
+                role="Conversation Guide",
+                goal="Engage users in friendly conversation about business ideas",
+                backstory="You help develop startup ideas with natural, concise responses.",
+                verbose=CREW_VERBOSE,
+                llm=self.llm,
+                output_observer=self._get_observer(sid)
+            )
+            self._agents[sid] = agent
+        return agent
+
+    def _get_observer(self, sid):
+        """Return the token streaming observer for a client, creating it on first use."""
+        observer = self._observers.get(sid)
+        if observer is None:
+            observer = StreamingObserver(sid)
+            self._observers[sid] = observer
+        return observer
+
+    def _flush_tokens(self, sid):
+        """Send any tokens still buffered for a client."""
+        observer = self._observers.get(sid)
+        if observer is not None:
+            observer.flush()
+
+    def _get_crew(self, sid, task):
+        """Return the crew for a client set up to run the given task."""
+        crew = self._crews.get(sid)
+        if crew is None:
+            crew = Crew(
+                agents=[task.agent],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=CREW_VERBOSE
+            )
+            self._crews[sid] = crew
+        else:
+            crew.tasks = [task]
+        return crew
+
+    def forget(self, sid):
+        """Drop any per-client state kept for a disconnected client."""
+        self._cancel_inflight(sid)
+        self._window_start.pop(sid, None)
+        self._fmt_cache.pop(sid, None)
+        with self._summary_lock:
+            self._summaries.pop(sid, None)
+            self._summarizing.pop(sid, None)
+        self._agents.pop(sid, None)
+        self._crews.pop(sid, None)
+        self._observers.pop(sid, None)
+
+    def _format_conversation_history(self, conversation_history, sid=None):
         """Format the conversation history for inclusion in the prompt."""
         if not conversation_history:
             return "No previous conversation."
             
-        formatted_history = ""
-        for msg in conversation_history:
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            formatted_history += f"{role.capitalize()}: {content}\n\n"
-            
-        return formatted_history
+        # Keep the window start fixed so each turn only appends to the
+        # previous prompt, sliding forward once the window gets too large
+        start = self._window_start.get(sid, 0)
+        if start > len(conversation_history) or len(conversation_history) - start >= 2 * HISTORY_WINDOW:
+            start = max(len(conversation_history) - HISTORY_WINDOW, 0)
+            self._window_start[sid] = start
+        summary = self._summary_prefix(conversation_history, start, sid)
+        
+        # History only grows between turns, so extend the previous result for
+        # this client with just the new messages. The last message it covered
+        # is compared to make sure it is still the same conversation.
+        cached = self._fmt_cache.get(sid)
+        if cached:
+            cached_start, cached_len, cached_tail, cached_text = cached
+            if (cached_start == start and start < cached_len <= len(conversation_history)
+                    and conversation_history[cached_len - 1] == cached_tail):
+                new_lines = [_format_history_line(msg) for msg in conversation_history[cached_len:]]
+                formatted = "\n\n".join([cached_text] + new_lines)
+                self._fmt_cache[sid] = (start, len(conversation_history), conversation_history[-1], formatted)
+                return summary + formatted
+        
+        formatted = "\n\n".join(
+            _format_history_line(msg) for msg in conversation_history[start:]
+        )
+        self._fmt_cache[sid] = (start, len(conversation_history), conversation_history[-1], formatted)
+        return summary + formatted
+
+    def _summary_prefix(self, conversation_history, start, sid):
+        """Return the summary and any unsummarized messages before the window."""
+        summary = self._summaries.get(sid)
+        if summary and (summary[0] > start or summary[1] != conversation_history[0]):
+            # The client started a new conversation
+            with self._summary_lock:
+                if self._summaries.get(sid) is summary:
+                    del self._summaries[sid]
+            summary = None
+        covered = summary[0] if summary else 0
+        if covered < start:
+            self._schedule_summary(sid, conversation_history[:start], summary)
+        prefix = f"Summary of earlier conversation: {summary[2]}\n\n" if summary else ""
+        # Until the summary catches up with the window, include the messages
+        # in between verbatim so nothing drops out of the prompt
+        gap = "".join(f"{_format_history_line(msg)}\n\n" for msg in conversation_history[covered:start])
+        return prefix + gap
+
+    def _schedule_summary(self, sid, earlier, summary):
+        """Summarize messages before the window in the background."""
+        job = (len(earlier), earlier[0])
+        with self._summary_lock:
+            running = self._summarizing.get(sid)
+            if running is not None and running[1] == job[1]:
+                # Already summarizing this conversation
+                return
+            self._summarizing[sid] = job
+        
+        def run_summary():
+            text = None
+            try:
+                # Only the messages not yet covered are sent, along with the
+                # previous summary
+                covered = summary[0] if summary else 0
+                text = self.summary_llm.call([{
+                    "role": "user",
+                    "content": _SUMMARY_TMPL.format_map({
+                        'summary': summary[2] if summary else "None yet.",
+                        'messages': "\n\n".join(_format_history_line(msg) for msg in earlier[covered:]),
+                    }),
+                }])
+            except Exception as e:
+                logger.error(f"Error summarizing conversation: {str(e)}")
+            finally:
+                with self._summary_lock:
+                    # Drop the result if the client disconnected or moved to
+                    # another conversation while this job was running
+                    if self._summarizing.get(sid) is job:
+                        del self._summarizing[sid]
+                        if text is not None:
+                            self._summaries[sid] = (job[0], job[1], text.strip())
+        
+        self._summary_pool.submit(run_summary)
+
+class HistoryMsg(msgspec.Struct):
+    """Schema of a single conversation history entry."""
+    role: str = "unknown"
+    content: str = ""
+
+class ChatMsg(msgspec.Struct):
+    """Schema of an incoming chat message."""
+    user_input: str = ""
+    title_context: str = ""
+    abstract_context: str = ""
+    conversation_history: list[HistoryMsg] = []
+
+_CHAT_MSG_DECODER = msgspec.json.Decoder(ChatMsg)
 
 # Initialize our handler
 crew_handler = CrewAIHandler()
@@ -124,20 +580,36 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection."""
     logger.info('Client disconnected')
+    crew_handler.forget(request.sid)
 
 @socketio.on('message', namespace='/api/ws')
 def handle_message(data):
     """Handle incoming WebSocket messages."""
     try:
-        # Parse the message data
-        message_data = json.loads(data) if isinstance(data, str) else data
+        # Parse and validate the message data
+        if isinstance(data, (str, bytes)):
+            message = _CHAT_MSG_DECODER.decode(data)
+        else:
+            message = msgspec.convert(data, ChatMsg)
+        
+        # Reject empty or oversized input without starting an LLM call. Like
+        # a busy rejection, this does not supersede a run already in flight.
+        user_input = message.user_input.strip()
+        if not user_input:
+            emit('message', {'error': 'Please type something.'})
+            emit('message', {'done': True})
+            return
+        if len(user_input) > MAX_INPUT_LENGTH:
+            emit('message', {'error': f'Message is too long (max {MAX_INPUT_LENGTH} characters)'})
+            emit('message', {'done': True})
+            return
         
         # Process with CrewAI
         crew_handler.process_streaming(
-            message_data.get("user_input", ""),
-            message_data.get("title_context", ""),
-            message_data.get("abstract_context", ""),
-            message_data.get("conversation_history", []),
+            user_input,
+            message.title_context,
+            message.abstract_context,
+            message.conversation_history,
             request.sid
         )
     except Exception as e:
@@ -146,6 +618,8 @@ def handle_message(data):
         emit('message', {'done': True})
 
 if __name__ == "__main__":
-    # Run the Flask application with SocketIO
+    # Run the Flask application with SocketIO. This is meant for development;
+    # in production serve with: gunicorn -k eventlet -w 1 -b 0.0.0.0:8000 app:app
+    debug = os.getenv('FLASK_DEBUG') == '1'
     logger.info("Starting Flask application with SocketIO on port 8000...")
-    socketio.run(app, host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    socketio.run(app, host="0.0.0.0", port=8000, debug=debug, use_reloader=debug, log_output=debug)
\ No newline at end of file
@@ -31,7 +31,8 @@ export default function Home() {
     if (!lastMessage) return;
     
     try {
-      const data = JSON.parse(lastMessage.data);
+      // The hook hands over already decoded payloads
+      const data = lastMessage;
       console.log("Received WebSocket data:", data);
       
       // Handle error
@@ -75,7 +76,7 @@ export default function Home() {
         setIsStreaming(false);
       }
     } catch (err) {
-      console.error("Failed to parse WebSocket message:", err, lastMessage);
+      console.error("Failed to handle WebSocket message:", err, lastMessage);
     }
   }, [lastMessage]);
 
@@ -20,9 +20,14 @@ const useWebSocket = (url) => {
       transports: ['websocket']
     });
 
+    // Sequence number of the last streamed token batch, used to detect gaps
+    let lastSeq = 0;
+
     // Set up event handlers
     socketInstance.on('connect', () => {
       console.log('WebSocket connected');
+      // The server numbers batches per connection, so start over
+      lastSeq = 0;
       setReadyState({ connected: true });
     });
 
@@ -33,7 +38,20 @@ const useWebSocket = (url) => {
 
     socketInstance.on('message', (data) => {
       console.log('Received message:', data);
-      setLastMessage({ data: JSON.stringify(data) });
+      setLastMessage(data);
+    });
+
+    // Streamed tokens arrive as a bare string plus sequence number
+    socketInstance.on('tok', (token, seq, ack) => {
+      if (seq !== lastSeq + 1) {
+        console.warn(`Missed streamed tokens: expected seq ${lastSeq + 1}, got ${seq}`);
+      }
+      lastSeq = seq;
+      setLastMessage({ token });
+      // Acknowledge so the server knows we are keeping up
+      if (typeof ack === 'function') {
+        ack();
+      }
     });
 
     socketInstance.on('connect_error', (error) => {